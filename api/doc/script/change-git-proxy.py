@@ -5,24 +5,23 @@ import os
 def get_proxy_settings():
     proxy_settings = {}
     try:
-        # 打开注册表键
-        key = winreg.OpenKey(winreg.HKEY_CURRENT_USER, r"Software\Microsoft\Windows\CurrentVersion\Internet Settings")
+        # 打开注册表键, 一次遍历读出所有值
+        with winreg.OpenKey(winreg.HKEY_CURRENT_USER,
+                            r"Software\Microsoft\Windows\CurrentVersion\Internet Settings",
+                            access=winreg.KEY_READ) as key:
+            value_count = winreg.QueryInfoKey(key)[1]
+            values = {name: value for name, value, _ in
+                      (winreg.EnumValue(key, i) for i in range(value_count))}
 
         # 获取代理启用状态
-        proxy_enabled, _ = winreg.QueryValueEx(key, "ProxyEnable")
+        proxy_enabled = values.get("ProxyEnable")
         proxy_settings["ProxyEnable"] = proxy_enabled
 
         if proxy_enabled:
             # 获取代理服务器地址
-            proxy_server, _ = winreg.QueryValueEx(key, "ProxyServer")
-            proxy_settings["ProxyServer"] = proxy_server
-
+            proxy_settings["ProxyServer"] = values.get("ProxyServer")
             # 获取代理跳过的地址（可选）
-            try:
-                proxy_bypass, _ = winreg.QueryValueEx(key, "ProxyOverride")
-                proxy_settings["ProxyOverride"] = proxy_bypass
-            except FileNotFoundError:
-                proxy_settings["ProxyOverride"] = None
+            proxy_settings["ProxyOverride"] = values.get("ProxyOverride")
 
     except Exception as e:
         proxy_settings["error"] = str(e)
@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+
+import sys
+import psycopg2
+import psycopg2.pool
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+METADATA_SQL = """
+    SELECT kind, table_name, payload FROM (
+        SELECT 'column' AS kind, table_name, ordinal_position AS ord,
+               jsonb_build_object(
+                   'column_name', column_name,
+                   'data_type', data_type,
+                   'char_max_len', character_maximum_length,
+                   'num_precision', numeric_precision,
+                   'num_scale', numeric_scale,
+                   'is_nullable', is_nullable,
+                   'column_default', column_default) AS payload
+        FROM information_schema.columns
+        WHERE table_schema = 'public'
+        UNION ALL
+        SELECT 'pk', tc.table_name, kcu.ordinal_position,
+               jsonb_build_object('column_name', kcu.column_name)
+        FROM information_schema.table_constraints tc
+        JOIN information_schema.key_column_usage kcu
+          ON tc.constraint_name = kcu.constraint_name
+         AND tc.table_schema = kcu.table_schema
+        WHERE tc.constraint_type = 'PRIMARY KEY'
+          AND tc.table_schema = 'public'
+        UNION ALL
+        SELECT 'fk', tc.table_name, kcu.ordinal_position,
+               jsonb_build_object(
+                   'column_name', kcu.column_name,
+                   'foreign_table', ccu.table_name,
+                   'foreign_column', ccu.column_name)
+        FROM information_schema.table_constraints tc
+        JOIN information_schema.key_column_usage kcu
+          ON tc.constraint_name = kcu.constraint_name
+         AND tc.table_schema = kcu.table_schema
+        JOIN information_schema.constraint_column_usage ccu
+          ON tc.constraint_name = ccu.constraint_name
+         AND tc.table_schema = ccu.table_schema
+        WHERE tc.constraint_type = 'FOREIGN KEY'
+          AND tc.table_schema = 'public'
+        UNION ALL
+        SELECT 'index', tablename, 0,
+               jsonb_build_object('indexname', indexname, 'indexdef', indexdef)
+        FROM pg_indexes
+        WHERE schemaname = 'public'
+          AND indexname NOT LIKE '%_pkey'
+    ) meta
+    ORDER BY kind, table_name, ord
+"""
+
+
+def fetch_schema_metadata(conn):
+    """
+    Fetch all schema metadata in a single UNION ALL round-trip, streamed
+    through a named (server-side) cursor so memory stays bounded by itersize
+
+    Returns:
+        tuple: (cols_by_table, pks_by_table, fks_by_table, idx_by_table)
+    """
+    grouped = {'column': {}, 'pk': {}, 'fk': {}, 'index': {}}
+    cursor = conn.cursor(name='ddl_export')
+    cursor.itersize = 2000
+    try:
+        cursor.execute(METADATA_SQL)
+        for kind, table_name, payload in cursor:
+            grouped[kind].setdefault(table_name, []).append(payload)
+    finally:
+        cursor.close()
+    return grouped['column'], grouped['pk'], grouped['fk'], grouped['index']
+
+
+_SIMPLE_TYPES = {
+    'integer': 'INTEGER',
+    'bigint': 'BIGINT',
+    'smallint': 'SMALLINT',
+    'boolean': 'BOOLEAN',
+    'date': 'DATE',
+    'timestamp without time zone': 'TIMESTAMP',
+    'timestamp with time zone': 'TIMESTAMPTZ',
+    'text': 'TEXT',
+    'json': 'JSON',
+    'jsonb': 'JSONB',
+}
+
+
+def format_column_type(data_type, char_max_len, num_precision, num_scale):
+    """Map an information_schema data_type to its DDL spelling"""
+    simple = _SIMPLE_TYPES.get(data_type)
+    if simple is not None:
+        return simple
+    if data_type == 'character varying':
+        return f'VARCHAR({char_max_len})' if char_max_len else 'VARCHAR'
+    if data_type == 'character':
+        return f'CHAR({char_max_len})' if char_max_len else 'CHAR'
+    if data_type == 'numeric':
+        if num_precision and num_scale is not None:
+            return f'NUMERIC({num_precision}, {num_scale})'
+        return 'NUMERIC'
+    return data_type.upper()
+
+
+def get_table_ddl(table_name, columns, primary_keys, foreign_keys):
+    """
+    Build the CREATE TABLE statement for one table from pre-grouped metadata
+
+    Args:
+        table_name (str): Table name
+        columns (list): Column metadata dicts built by jsonb_build_object
+        primary_keys (list): Primary key column dicts
+        foreign_keys (list): Foreign key dicts
+
+    Returns:
+        str: CREATE TABLE statement
+    """
+    parts = []
+    for col in columns:
+        col_def = f"    {col['column_name']} {format_column_type(col['data_type'], col['char_max_len'], col['num_precision'], col['num_scale'])}"
+        if col['is_nullable'] == 'NO':
+            col_def += ' NOT NULL'
+        if col['column_default'] is not None:
+            col_def += f" DEFAULT {col['column_default']}"
+        parts.append(col_def)
+
+    if primary_keys:
+        pk_columns = ', '.join(pk['column_name'] for pk in primary_keys)
+        parts.append(f'    PRIMARY KEY ({pk_columns})')
+
+    for fk in foreign_keys:
+        parts.append(f"    FOREIGN KEY ({fk['column_name']}) REFERENCES {fk['foreign_table']} ({fk['foreign_column']})")
+
+    return f'CREATE TABLE {table_name} (\n' + ',\n'.join(parts) + '\n);'
+
+
+def get_indexes_ddl(indexes):
+    """
+    Build index statements for one table from pre-grouped pg_indexes rows
+
+    Args:
+        indexes (list): Index dicts built by jsonb_build_object
+
+    Returns:
+        list: CREATE INDEX statements
+    """
+    return [f"{idx['indexdef']};" for idx in indexes]
+
+
+def export_database_ddl(host, port, username, database, output_file, password=None):
+    """
+    Export DDL for all tables in the public schema to a single SQL file
+
+    Args:
+        host (str): Database host
+        port (str): Database port
+        username (str): Database username
+        database (str): Database name
+        output_file (str): Output file path
+        password (str, optional): Database password
+
+    Returns:
+        bool: True if export successful, False otherwise
+    """
+    try:
+        pool = psycopg2.pool.SimpleConnectionPool(1, 4, host=host, port=port,
+                                                  user=username, dbname=database,
+                                                  password=password)
+    except psycopg2.Error as e:
+        print(f"Connection failed: {e}")
+        return False
+
+    conn = pool.getconn()
+    try:
+        cols_by_table, pks_by_table, fks_by_table, idx_by_table = fetch_schema_metadata(conn)
+        tables = sorted(cols_by_table)
+        print(f"Found {len(tables)} tables")
+
+        def render_table(table_name):
+            parts = [get_table_ddl(table_name,
+                                   cols_by_table[table_name],
+                                   pks_by_table.get(table_name, []),
+                                   fks_by_table.get(table_name, []))]
+            parts.extend(get_indexes_ddl(idx_by_table.get(table_name, [])))
+            return '\n'.join(parts)
+
+        # Write each segment straight to the file instead of collecting
+        # every statement in a list and joining it into one big string
+        with open(output_file, 'w', encoding='utf-8') as f:
+            f.write(f'-- Schema DDL for database {database}\n')
+            f.write(f'-- Generated at {datetime.now().isoformat()}\n')
+            f.write('\n')
+            # executor.map keeps results in table order regardless of completion order
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                for table_name, table_ddl in zip(tables, executor.map(render_table, tables)):
+                    print(f"Exporting table: {table_name}")
+                    f.write(table_ddl)
+                    f.write('\n\n')
+        return True
+    except psycopg2.Error as e:
+        print(f"Export failed: {e}")
+        return False
+    finally:
+        pool.putconn(conn)
+        pool.closeall()
+
+
+def main():
+    """Main function to execute the DDL export"""
+    host = '127.0.0.1'
+    port = 15432
+    username = 'postgres'
+    database = 'investment_research'
+    password = '123456'
+
+    output_file = 'C:/rock/coding/code/my/rust/Rock-Market-Lab/api/doc/script/db/sql/investment_research_ddl.sql'
+
+    print("PostgreSQL DDL Export")
+    print("=" * 40)
+    print(f"Host: {host}")
+    print(f"Port: {port}")
+    print(f"Username: {username}")
+    print(f"Database: {database}")
+    print(f"Output: {output_file}")
+    print("=" * 40)
+
+    success = export_database_ddl(
+        host=host,
+        port=port,
+        username=username,
+        database=database,
+        output_file=output_file,
+        password=password
+    )
+
+    if success:
+        print("\n✅ DDL export completed successfully!")
+        sys.exit(0)
+    else:
+        print("\n❌ DDL export failed!")
+        sys.exit(1)
+
+main()
@@ -7,22 +7,24 @@ import argparse
 from datetime import datetime
 from pathlib import Path
 
-def export_schema(host, port, username, database, output_file, password=None):
+def export_schema(host, port, username, database, output_path, password=None, directory_format=True, jobs=4):
     """
     Export PostgreSQL database schema using pg_dump
-    
+
     Args:
         host (str): Database host
         port (str): Database port
         username (str): Database username
         database (str): Database name
-        output_file (str): Output file path
+        output_path (str): Output path (directory for -Fd, file for plain text)
         password (str, optional): Database password
-    
+        directory_format (bool): Use custom directory format with parallel dump jobs
+        jobs (int): Number of parallel dump jobs for directory format
+
     Returns:
         bool: True if export successful, False otherwise
     """
-    
+
     # Build pg_dump command
     cmd = [
         'pg_dump',
@@ -33,16 +35,27 @@ def export_schema(host, port, username, database, output_file, password=None):
         '--schema-only',  # Export only schema, no data
         '--no-owner',     # Don't output commands to set ownership
         '--no-privileges', # Don't output commands to set privileges
-        '--verbose',      # Verbose output
-        '-f', f'{output_file}'
     ]
-    
+    if directory_format:
+        # Directory format dumps schemas with parallel worker processes
+        cmd += ['-Fd', '-j', str(jobs)]
+    else:
+        # Plain text output is local, skip compression
+        cmd += ['-Fp', '-Z0']
+    cmd += ['-f', str(output_path)]
+
+    env = dict(os.environ)
+    if password is not None:
+        env['PGPASSWORD'] = password
+
     try:
-        print(f"Exporting schema from database '{database}' to '{output_file}'...")
+        print(f"Exporting schema from database '{database}' to '{output_path}'...")
         print(f"Command: {' '.join(cmd)}")
-        os.chdir("C:/rock/coding/code/my/rust/Rock-Market-Lab/api/doc/script/db/sql")
-        os.system(" ".join(cmd))
+        subprocess.run(cmd, env=env, check=True, stdout=subprocess.PIPE)
         return True
+    except subprocess.CalledProcessError as e:
+        print(f"pg_dump failed with exit code {e.returncode}")
+        return False
     except Exception as e:
         print(f"Unexpected error: {e}")
         return False
@@ -55,10 +68,10 @@ def main():
     username = 'postgres'
     database = 'investment_research'
     password = '123456'
-    
+
     # Create output directory if it doesn't exist
     output_path = 'C:/rock/coding/code/my/rust/Rock-Market-Lab/api/doc/script/db/sql/investment_research.sql'
-    
+
     # Display connection info
     print("PostgreSQL Schema Export")
     print("=" * 40)
@@ -68,17 +81,18 @@ def main():
     print(f"Database: {database}")
     print(f"Output: {output_path}")
     print("=" * 40)
-    
+
     # Export schema
     success = export_schema(
         host=host,
         port=port,
         username=username,
         database=database,
-        output_file=output_path,
-        password=password
+        output_path=output_path,
+        password=password,
+        directory_format=False
     )
-    
+
     if success:
         print("\n✅ Schema export completed successfully!")
         sys.exit(0)
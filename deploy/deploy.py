@@ -1,11 +1,30 @@
 import paramiko
 import zipfile
+import tarfile
 import os
-import shutil
+import subprocess
 import time
-
-project_dir = 'C:/rock/coding/code/my/rust/programmer-investment-research'
-blog_dir = 'C:/rock/coding/code/my/rust/programmer-investment-research/blog'
+import atexit
+import threading
+import queue
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# Fall back to the zip path by flipping this (or when zstandard is missing)
+use_zstd = True
+
+# Local paths built once; remote paths stay plain POSIX strings
+PROJECT_DIR = Path('C:/rock/coding/code/my/rust/programmer-investment-research')
+API_DIR = PROJECT_DIR / 'api'
+BLOG_DIR = PROJECT_DIR / 'blog'
+DEPLOY_DIR = PROJECT_DIR / 'deploy'
+DIST_DIR = DEPLOY_DIR / 'dist'
+PY_API_DIR = PROJECT_DIR / 'python-api'
 api_deploy_dir = '/home/ubuntu/investment-research/deploy/api'
 upload_dir = '/home/ubuntu/investment-research/upload_tmp'
 
@@ -14,7 +33,11 @@ class Ssh:
         self.ssh = paramiko.SSHClient()
         self.ssh.set_missing_host_key_policy(paramiko.AutoAddPolicy())
         self.ssh.connect(server, 22, username=username, password=password)
-        self.scp = self.ssh.open_sftp()
+        transport = self.ssh.get_transport()
+        # Larger SFTP window/packet sizes keep the pipe full on high-RTT links
+        transport.default_window_size = 2 ** 27
+        transport.default_max_packet_size = 2 ** 19
+        self.scp = paramiko.SFTPClient.from_transport(transport)
 
     def download(self, remote_file, localpath):
         self.scp.get(remote_file, localpath)
@@ -22,77 +45,124 @@ class Ssh:
     def upload(self, local_file, remotepath):
         self.scp.put(local_file, remotepath)
 
- 
+    def close(self):
+        self.scp.close()
+        self.ssh.close()
+
+    def upload_many(self, pairs, max_workers=4):
+        # One SFTPClient per worker thread so transfers run concurrently
+        thread_local = threading.local()
+        def put(pair):
+            local_file, remotepath = pair
+            if not hasattr(thread_local, 'scp'):
+                thread_local.scp = paramiko.SFTPClient.from_transport(self.ssh.get_transport())
+            thread_local.scp.put(local_file, remotepath)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(put, pairs))
 
     def exec(self, cmd_str):
         (stdin, stdout, stderr) = self.ssh.exec_command(cmd_str)
-        output = stdout.read().decode("utf-8")
-        err = stderr.read().decode("utf-8")
-        print(output)
-        print(err)
+        # Stream line by line so long commands don't buffer in-kernel or stall on backpressure
+        for line in iter(stdout.readline, ''):
+            print(line, end='')
+        stdout.channel.recv_exit_status()
+        for line in iter(stderr.readline, ''):
+            print(line, end='')
 
     def exec_batch(self, cmd_arr):
         cmd_str = '; '.join(cmd_arr)
-        (stdin, stdout, stderr) = self.ssh.exec_command(cmd_str)
-        output = stdout.read().decode("utf-8")
-        err = stderr.read().decode("utf-8")
-        print(output)
-        print(err)
-
-def deploy_blog(server, username, password):
-    os.chdir(blog_dir)
-    os.system('hugo')
+        # get_pty merges stderr into stdout so neither stream blocks the other
+        (stdin, stdout, stderr) = self.ssh.exec_command(cmd_str, get_pty=True)
+        for line in iter(stdout.readline, ''):
+            print(line, end='')
+        stdout.channel.recv_exit_status()
+
+def run_streamed(cmd, cwd=None):
+    # Stream child output so build progress shows up as it happens
+    proc = subprocess.Popen(cmd, cwd=cwd, stdout=subprocess.PIPE,
+                            stderr=subprocess.STDOUT, text=True, bufsize=1)
+    for line in proc.stdout:
+        print(line, end='')
+    if proc.wait() != 0:
+        raise subprocess.CalledProcessError(proc.returncode, cmd)
+
+def deploy_blog(ssh):
+    subprocess.run(['hugo'], cwd=BLOG_DIR, check=True)
     print('build hugo complete...')
-    zip_directory(f'{blog_dir}/public', f'{blog_dir}/public.zip')
-    ssh = Ssh(server, username=username, password=password)
-    print('upload zip...')
-    ssh.exec('cd /home/ubuntu/investment-research/upload_tmp; sudo rm blog.zip; sudo rm -rf blog;')
-    ssh.upload('public.zip', '/home/ubuntu/investment-research/upload_tmp/blog.zip')
-    ssh.exec('cd /home/ubuntu/investment-research/upload_tmp; sudo unzip blog.zip -d blog')
+    ssh.exec('cd /home/ubuntu/investment-research/upload_tmp; sudo rm blog.zip blog.tar.zst; sudo rm -rf blog;')
+    if use_zstd and zstandard is not None:
+        tar_zst_directory(BLOG_DIR / 'public', BLOG_DIR / 'public.tar.zst')
+        print('upload tar.zst...')
+        ssh.upload(str(BLOG_DIR / 'public.tar.zst'), '/home/ubuntu/investment-research/upload_tmp/blog.tar.zst')
+        ssh.exec('cd /home/ubuntu/investment-research/upload_tmp; mkdir blog; sudo tar --zstd -xf blog.tar.zst -C blog')
+    else:
+        zip_directory(BLOG_DIR / 'public', BLOG_DIR / 'public.zip')
+        print('upload zip...')
+        ssh.upload(str(BLOG_DIR / 'public.zip'), '/home/ubuntu/investment-research/upload_tmp/blog.zip')
+        ssh.exec('cd /home/ubuntu/investment-research/upload_tmp; sudo unzip blog.zip -d blog')
     ssh.exec('cd /home/ubuntu/investment-research; sudo cp -rf upload_tmp/blog deploy/blog; echo "deploy success: $?"')
 
-def deploy_nginx(server, username, password):
-    ssh = Ssh(server, username=username, password=password)
-    os.chdir('C:/rock/coding/code/my/rust/programmer-investment-research/deploy')
-    ssh.upload('nginx.conf', '/home/ubuntu/investment-research/upload_tmp/nginx.conf')
-    ssh.upload('play-investment.conf', '/home/ubuntu/investment-research/upload_tmp/play-investment.conf')
+def deploy_nginx(ssh):
+    ssh.upload(str(DEPLOY_DIR / 'nginx.conf'), '/home/ubuntu/investment-research/upload_tmp/nginx.conf')
+    ssh.upload(str(DEPLOY_DIR / 'play-investment.conf'), '/home/ubuntu/investment-research/upload_tmp/play-investment.conf')
     ssh.exec('cd /home/ubuntu/investment-research/upload_tmp; sudo cp -rf nginx.conf /etc/nginx; sudo cp -rf play-investment.conf /etc/nginx/conf.d;')
     ssh.exec('sudo pkill nginx; sudo nginx')
 
-def zip_directory(folder_path, zip_filename):
-    with zipfile.ZipFile(zip_filename, 'w', zipfile.ZIP_DEFLATED) as zipf:
+def tar_zst_directory(folder_path, archive_filename):
+    # zstd compresses across all cores with threads=-1; gzip/deflate cannot
+    cctx = zstandard.ZstdCompressor(level=3, threads=-1)
+    with open(archive_filename, 'wb') as fh, cctx.stream_writer(fh) as compressor, \
+            tarfile.open(fileobj=compressor, mode='w|') as tar:
+        tar.add(folder_path, arcname='.')
+
+# Already-compressed formats: recompressing them just burns CPU
+STORED_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.webp', '.woff2', '.gz', '.br')
+
+def zip_directory(folder_path, zip_filename, level=1):
+    # Walk the tree in a background thread so directory scanning and stat
+    # calls overlap with deflate; None on the queue marks the end of the walk
+    file_queue = queue.Queue(maxsize=64)
+
+    def walker():
         for root, dirs, files in os.walk(folder_path):
             for file in files:
                 file_path = os.path.join(root, file)
                 arcname = os.path.relpath(file_path, folder_path)
+                file_queue.put((file_path, arcname))
+        file_queue.put(None)
+
+    threading.Thread(target=walker, daemon=True).start()
+    # The archive only lives until the server unzips it, so cheap deflate is enough
+    with zipfile.ZipFile(zip_filename, 'w', zipfile.ZIP_DEFLATED, compresslevel=level) as zipf:
+        while True:
+            item = file_queue.get()
+            if item is None:
+                break
+            file_path, arcname = item
+            if file_path.lower().endswith(STORED_EXTENSIONS):
+                zipf.write(file_path, arcname, compress_type=zipfile.ZIP_STORED)
+            else:
                 zipf.write(file_path, arcname)
 
 def build_docker():
-    os.chdir(f'{project_dir}/api')
-    os.system('docker build -t security-api:v1 .')
-    os.system('docker run -d --name security-api-app1 security-api:v1 sleep infinity')
+    run_streamed(['docker', 'build', '-t', 'security-api:v1', '.'], cwd=API_DIR)
+    run_streamed(['docker', 'run', '-d', '--name', 'security-api-app1', 'security-api:v1', 'sleep', 'infinity'])
     print('run docker success..')
     time.sleep(10)
-    os.system(f'docker cp security-api-app1:/app/security_app {project_dir}/deploy/dist')
+    run_streamed(['docker', 'cp', 'security-api-app1:/app/security_app', str(DIST_DIR)])
     print('copy docker file to host success')
 
-def deploy_api(server, username, password):
-    shutil.copyfile(f'{project_dir}/api/app_config/cfg/config-prod.toml', f'{project_dir}/deploy/dist/config.toml')
-    shutil.copyfile(f'{project_dir}/api/app_config/cfg/log4rs-prod.yml', f'{project_dir}/deploy/dist/log4rs.yml')
-    print('copy to dist complete')
-
-    ssh = Ssh(server, username=username, password=password)
-    os.chdir(f'{project_dir}/deploy/dist')
-    ssh.upload('security_app', f'{upload_dir}/security_app')
-    ssh.upload('config.toml',  f'{upload_dir}/config.toml')
-    ssh.upload('log4rs.yml',  f'{upload_dir}/log4rs.yml')
-    
-    os.chdir(f'{project_dir}/python-api')
-    ssh.upload('server.py',  f'{upload_dir}/server.py')
-
-    os.chdir(f'{project_dir}/deploy')
+def deploy_api(ssh):
+    # Upload configs straight from the source tree; no staging copy in dist
+    pairs = [
+        (str(DIST_DIR / 'security_app'), f'{upload_dir}/security_app'),
+        (str(API_DIR / 'app_config' / 'cfg' / 'config-prod.toml'), f'{upload_dir}/config.toml'),
+        (str(API_DIR / 'app_config' / 'cfg' / 'log4rs-prod.yml'), f'{upload_dir}/log4rs.yml'),
+        (str(PY_API_DIR / 'server.py'), f'{upload_dir}/server.py'),
+        (str(DEPLOY_DIR / 'investment-research-db.sql'), f'{upload_dir}/investment-research-db.sql'),
+    ]
     print("begin upload...")
-    ssh.upload('investment-research-db.sql',  f'{upload_dir}/investment-research-db.sql')
+    ssh.upload_many(pairs)
     print("upload complete...")
 
     ssh.exec_batch([f'cd {upload_dir}',
@@ -104,8 +174,11 @@ def deploy_api(server, username, password):
 
 # (server, username, password) = ('xx', 'xx', 'xx')
 (server, username, password) = ('123.207.73.59', 'ubuntu', '@Ke2023River1878')
+# One handshake for the whole run; every deploy step reuses the same channel
+ssh = Ssh(server, username=username, password=password)
+atexit.register(ssh.close)
 # build_docker()
-# deploy_api(server, username, password)
-deploy_blog(server, username, password)
-# deploy_nginx(server, username, password)
+# deploy_api(ssh)
+deploy_blog(ssh)
+# deploy_nginx(ssh)
 print('deploy complete...')
\ No newline at end of file
@@ -1,36 +1,55 @@
-import web
-import json
-from xpinyin import Pinyin
+import functools
 import os
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
+from starlette.middleware.gzip import GZipMiddleware
+from pypinyin import lazy_pinyin, Style
 
-urls = (
-    '/api/pinyin', 'PinyinController',
-    '/api/tushare', 'TushareController'
-)
-app = web.application(urls, globals())
-p = Pinyin()
+app = FastAPI()
+# Compress bodies over 512 bytes; keep-alive is on by default under uvicorn
+app.add_middleware(GZipMiddleware, minimum_size=512)
 
-class PinyinController:
-    def GET(self):
-        return 'pinyin'
-    def POST(self):
-        data = json.loads(web.data())
-        value = data["word"]
-        print(value)
-        return get_first_chinese_letter(value)
 
-def get_first_chinese_letter(word):
-    result1 = p.get_pinyin(word)
-    parts = list(map(lambda p: p[0], result1.split('-')))
-    return ''.join(parts)
+@app.get('/api/pinyin')
+async def pinyin_info():
+    return 'pinyin'
 
 
-class TushareController:
-    def POST(self):
-        pass
+# Plain text keeps the response contract of the old web.py server:
+# the rust caller reads the raw body as the initials string
+@app.post('/api/pinyin', response_class=PlainTextResponse)
+async def pinyin(body: dict):
+    value = body["word"]
+    print(value)
+    return _TABLE.get(value) or _pinyin_initials(value)
 
 
+@app.post('/api/tushare')
+async def tushare(body: dict):
+    pass
+
+
+# Stock names repeat constantly, so cache hits skip the pinyin lookup entirely
+@functools.lru_cache(maxsize=16384)
+def _pinyin_initials(word):
+    return ''.join(lazy_pinyin(word, style=Style.FIRST_LETTER, errors='default'))
+
+
+# Optional list of known company names (one per line); precomputing their
+# initials at startup turns the common case into a plain dict hit
+_COMPANIES_CSV = os.path.join(os.path.dirname(__file__), 'companies.csv')
+
+def _load_initials_table():
+    if not os.path.exists(_COMPANIES_CSV):
+        return {}
+    with open(_COMPANIES_CSV, encoding='utf-8') as f:
+        names = [line.strip() for line in f if line.strip()]
+    return {name: _pinyin_initials(name) for name in names}
+
+_TABLE = _load_initials_table()
+
 
 if __name__ == "__main__":
-    os.environ["PORT"] = "18091"
-    app.run()
\ No newline at end of file
+    import uvicorn
+    # production: uvicorn server:app --workers 4 --loop uvloop --http httptools --port 18091
+    uvicorn.run('server:app', host='0.0.0.0', port=18091)